@@ -1,26 +1,80 @@
 import streamlit as st
-import re
 import math
+import bisect
 from typing import Dict, Tuple, List
 
+_LOG10_OF_2 = math.log10(2)
+_LOG2_1E9 = math.log2(1e9)
+
+# Crack-time display buckets: (upper bound in seconds, divisor, unit).
+# Anything past the last bound reads "More than 1000 years".
+_TIME_BUCKETS = [
+    (60, 1, 'seconds'),
+    (3600, 60, 'minutes'),
+    (86400, 3600, 'hours'),
+    (31536000, 86400, 'days'),
+    (31536000000, 31536000, 'years'),
+]
+_TIME_THRESHOLDS = [bucket[0] for bucket in _TIME_BUCKETS]
+
+
 class PasswordAnalyzer:
     """Enhanced password analyzer with comprehensive strength checking."""
-    
+
+    _LOG2_CACHE = {}  # charset_size -> log2(charset_size), shared across instances
+
     def __init__(self):
         self.character_sets = {
-            'lowercase': {'pattern': r'[a-z]', 'size': 26, 'name': 'Lowercase letters'},
-            'uppercase': {'pattern': r'[A-Z]', 'size': 26, 'name': 'Uppercase letters'},
-            'digits': {'pattern': r'[0-9]', 'size': 10, 'name': 'Numbers'},
-            'special': {'pattern': r'[^a-zA-Z0-9\s]', 'size': 32, 'name': 'Special characters'}
+            'lowercase': {'bit': 1, 'size': 26, 'name': 'Lowercase letters'},
+            'uppercase': {'bit': 2, 'size': 26, 'name': 'Uppercase letters'},
+            'digits': {'bit': 4, 'size': 10, 'name': 'Numbers'},
+            'special': {'bit': 8, 'size': 32, 'name': 'Special characters'}
         }
-        
-        self.common_patterns = [
-            r'(.)\1{2,}',  # Repeated characters
-            r'(012|123|234|345|456|567|678|789|890)',  # Sequential numbers
-            r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)',  # Sequential letters
-            r'(qwerty|asdf|zxcv|password|admin|login|welcome)',  # Common keyboard patterns and words
-        ]
-        
+
+        # 256-entry table mapping each byte to its character-class bitmask,
+        # so composition analysis is one translate pass instead of four
+        # regex scans. Non-ASCII bytes count as special, like [^a-zA-Z0-9\s].
+        class_table = bytearray(256)
+        for value in range(256):
+            if 0x61 <= value <= 0x7A:
+                class_table[value] = 1  # lowercase
+            elif 0x41 <= value <= 0x5A:
+                class_table[value] = 2  # uppercase
+            elif 0x30 <= value <= 0x39:
+                class_table[value] = 4  # digits
+            elif value not in b' \t\n\r\x0b\x0c':
+                class_table[value] = 8  # special
+        self._class_table = bytes(class_table)
+        
+        # Weak-pattern tables: sequential runs are detected by 3-gram set
+        # membership (one O(1) lookup per position instead of walking a
+        # regex alternation), keywords by plain substring search.
+        digits = '0123456789'
+        letters = 'abcdefghijklmnopqrstuvwxyz'
+        self._seq_trigrams = frozenset(
+            [digits[i:i + 3] for i in range(len(digits) - 2)] + ['890'] +
+            [letters[i:i + 3] for i in range(len(letters) - 2)]
+        )
+        self._keywords = ('qwerty', 'asdf', 'zxcv', 'password', 'admin', 'login', 'welcome')
+
+        # Suggestion strings are constant per character type and pattern
+        # label, so format them once here instead of on every call.
+        self._missing_suggestions = {
+            info['name']: f"🔸 Add {info['name'].lower()}"
+            for info in self.character_sets.values()
+        }
+        self._pattern_warnings = {
+            label: f"🔸 Avoid: {label}"
+            for label in ("Contains repeated characters",
+                          "Contains sequential characters",
+                          "Contains common patterns or words")
+        }
+        self._good_password_suggestions = (
+            "✅ Your password has good character diversity!",
+            "💡 Consider using a passphrase with random words",
+            "💡 Enable two-factor authentication when possible",
+        )
+
         self.strength_thresholds = {
             'very_weak': 35,
             'weak': 59,
@@ -29,14 +83,32 @@ class PasswordAnalyzer:
             'very_strong': 120
         }
 
+        # Sorted bounds + category table so get_strength_category is a
+        # single bisect instead of an if/elif ladder.
+        self._strength_bounds = [self.strength_thresholds[key]
+                                 for key in ('very_weak', 'weak', 'moderate', 'strong')]
+        self._strength_categories = (
+            ("Very Weak", "🔴", "danger"),
+            ("Weak", "🟠", "warning"),
+            ("Moderate", "🟡", "info"),
+            ("Strong", "🟢", "success"),
+            ("Very Strong", "🔵", "success"),
+        )
+
     def analyze_character_composition(self, password: str) -> Dict:
         """Analyze which character types are present in the password."""
         composition = {}
         total_charset_size = 0
         missing_types = []
-        
+
+        # One pass over the bytes: translate each to its class bitmask and
+        # OR the distinct masks together.
+        mask = 0
+        for class_bits in set(password.encode('utf-8', 'ignore').translate(self._class_table)):
+            mask |= class_bits
+
         for char_type, info in self.character_sets.items():
-            present = bool(re.search(info['pattern'], password))
+            present = bool(mask & info['bit'])
             composition[char_type] = present
             if present:
                 total_charset_size += info['size']
@@ -49,99 +121,228 @@ class PasswordAnalyzer:
             'missing_types': missing_types
         }
 
-    def calculate_entropy(self, password: str) -> float:
-        """Calculate password entropy based on character set and length."""
+    def calculate_entropy(self, password: str, analysis: Dict = None) -> float:
+        """Calculate password entropy based on character set and length.
+
+        Pass a precomputed ``analyze_character_composition`` result to avoid
+        re-scanning the password.
+        """
         if not password:
             return 0
-        
-        analysis = self.analyze_character_composition(password)
+
+        if analysis is None:
+            analysis = self.analyze_character_composition(password)
         charset_size = analysis['charset_size']
         
         if charset_size == 0:
             charset_size = 1  # Prevent log(0)
         
-        entropy = math.log2(math.pow(charset_size,len(password)))
+        entropy = len(password) * self._LOG2_CACHE.setdefault(charset_size, math.log2(charset_size))
         return entropy
 
+    def _has_keyword(self, password_lower: str) -> bool:
+        """True if the password contains a common word or keyboard run."""
+        return any(keyword in password_lower for keyword in self._keywords)
+
     def check_common_patterns(self, password: str) -> List[str]:
         """Check for common weak patterns in password."""
+        password_lower = password.lower()
+
+        # One windowed traversal answers both 3-character checks, with an
+        # early exit once both have fired.
+        has_repeat = has_sequential = False
+        for i in range(len(password_lower) - 2):
+            window = password_lower[i:i + 3]
+            if not has_repeat and window[0] == window[1] == window[2]:
+                has_repeat = True
+                if has_sequential:
+                    break
+            if not has_sequential and window in self._seq_trigrams:
+                has_sequential = True
+                if has_repeat:
+                    break
+
         found_patterns = []
-        
-        for pattern in self.common_patterns:
-            if re.search(pattern, password.lower()):
-                if 'repeated' in pattern or r'(.)\1{2,}' == pattern:
-                    found_patterns.append("Contains repeated characters")
-                elif any(seq in pattern for seq in ['012', '123', 'abc']):
-                    found_patterns.append("Contains sequential characters")
-                else:
-                    found_patterns.append("Contains common patterns or words")
-        
+        if has_repeat:
+            found_patterns.append("Contains repeated characters")
+        if has_sequential:
+            found_patterns.append("Contains sequential characters")
+        if self._has_keyword(password_lower):
+            found_patterns.append("Contains common patterns or words")
+
         return found_patterns
 
     def get_strength_category(self, entropy: float) -> Tuple[str, str, str]:
         """Determine password strength category based on entropy."""
-        if entropy <= self.strength_thresholds['very_weak']:
-            return "Very Weak", "🔴", "danger"
-        elif entropy <= self.strength_thresholds['weak']:
-            return "Weak", "🟠", "warning"
-        elif entropy <= self.strength_thresholds['moderate']:
-            return "Moderate", "🟡", "info"
-        elif entropy <= self.strength_thresholds['strong']:
-            return "Strong", "🟢", "success"
-        else:
-            return "Very Strong", "🔵", "success"
+        return self._strength_categories[bisect.bisect_left(self._strength_bounds, entropy)]
 
     def estimate_crack_time(self, entropy: float) -> str:
         """Estimate time to crack password assuming 1 billion guesses per second."""
         if entropy <= 0:
             return "Instantly"
         
-        combinations = 2 ** entropy
-        # Assuming 10^9 guesses per second (modern hardware)
-        seconds = combinations / (2 * 10**9)  # Divide by 2 for average case
-        
-        if seconds < 60:
-            return f"{seconds:.1f} seconds"
-        elif seconds < 3600:
-            return f"{seconds/60:.1f} minutes"
-        elif seconds < 86400:
-            return f"{seconds/3600:.1f} hours"
-        elif seconds < 31536000:
-            return f"{seconds/86400:.1f} days"
-        elif seconds < 31536000000:
-            return f"{seconds/31536000:.1f} years"
-        else:
+        # Assuming 10^9 guesses per second (modern hardware) and the average
+        # case (half the keyspace): seconds = 2**entropy / (2 * 10^9), kept
+        # in the exponent domain so high entropy can't overflow a float.
+        exponent = entropy - 1 - _LOG2_1E9
+        if exponent > 60:  # far beyond the last display bucket
+            return "More than 1000 years"
+        seconds = 2.0 ** exponent
+
+        index = bisect.bisect_right(_TIME_THRESHOLDS, seconds)
+        if index == len(_TIME_BUCKETS):
             return "More than 1000 years"
+        _, divisor, unit = _TIME_BUCKETS[index]
+        return f"{seconds / divisor:.1f} {unit}"
 
-    def generate_suggestions(self, password: str) -> List[str]:
-        """Generate specific suggestions to improve password strength."""
+    def generate_suggestions(self, password: str, analysis: Dict = None,
+                             patterns: List[str] = None) -> Tuple[str, ...]:
+        """Generate specific suggestions to improve password strength.
+
+        ``analysis`` and ``patterns`` can be precomputed results from
+        ``analyze_character_composition`` and ``check_common_patterns``.
+        """
         suggestions = []
-        analysis = self.analyze_character_composition(password)
-        
+        if analysis is None:
+            analysis = self.analyze_character_composition(password)
+
         # Length suggestions
         if len(password) < 8:
             suggestions.append("🔸 Use at least 8 characters (12+ recommended)")
         elif len(password) < 12:
             suggestions.append("🔸 Consider using 12+ characters for better security")
-        
+
         # Character type suggestions
         for missing_type in analysis['missing_types']:
-            suggestions.append(f"🔸 Add {missing_type.lower()}")
-        
+            suggestions.append(self._missing_suggestions[missing_type])
+
         # Pattern warnings
-        patterns = self.check_common_patterns(password)
+        if patterns is None:
+            patterns = self.check_common_patterns(password)
         for pattern in patterns:
-            suggestions.append(f"🔸 Avoid: {pattern}")
-        
+            suggestions.append(self._pattern_warnings[pattern])
+
         # General suggestions
         if not suggestions:
-            suggestions.extend([
-                "✅ Your password has good character diversity!",
-                "💡 Consider using a passphrase with random words",
-                "💡 Enable two-factor authentication when possible"
-            ])
-        
-        return suggestions
+            return self._good_password_suggestions
+
+        return tuple(suggestions)
+
+    def analyze(self, password: str) -> Dict:
+        """Run the full analysis in one pass and return all derived fields."""
+        analysis = self.analyze_character_composition(password)
+        entropy = self.calculate_entropy(password, analysis)
+        patterns = self.check_common_patterns(password)
+        return {
+            'entropy': entropy,
+            'composition': analysis['composition'],
+            'charset_size': analysis['charset_size'],
+            'missing_types': analysis['missing_types'],
+            'patterns': patterns,
+            'suggestions': self.generate_suggestions(password, analysis, patterns),
+            'strength': self.get_strength_category(entropy),
+            'crack_time': self.estimate_crack_time(entropy),
+        }
+
+
+@st.cache_resource
+def get_analyzer() -> PasswordAnalyzer:
+    """Build the analyzer once and share it across reruns and sessions."""
+    return PasswordAnalyzer()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def analyze_password(password: str) -> Dict:
+    """Run the full analysis once per distinct password.
+
+    Streamlit reruns the whole script on every widget interaction; caching
+    on the password string means toggles and other widgets reuse the
+    previous result instead of re-running every scan.
+    """
+    return get_analyzer().analyze(password)
+
+
+@st.fragment
+def render_analysis(password: str):
+    """Render the analysis section for the entered password.
+
+    Runs as a fragment so interactions with widgets elsewhere on the page
+    rerun only this block's owner, not a full re-analysis per interaction.
+    """
+    analyzer = get_analyzer()
+
+    # Calculate metrics (cached per password across reruns)
+    result = analyze_password(password)
+    entropy = result['entropy']
+    strength, emoji, alert_type = result['strength']
+    crack_time = result['crack_time']
+    patterns = result['patterns']
+    suggestions = result['suggestions']
+
+    # Display results in columns
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Password Length", len(password))
+
+    with col2:
+        st.metric("Entropy", f"{entropy:.1f} bits")
+
+    with col3:
+        st.metric("Character Types", sum(result['composition'].values()))
+
+    with col4:
+        st.metric("Charset Size", result['charset_size'])
+
+    # Strength indicator
+    st.markdown("### Strength Assessment")
+
+    if alert_type == "danger":
+        st.error(f"{emoji} **{strength}** - This password is easily crackable!")
+    elif alert_type == "warning":
+        st.warning(f"{emoji} **{strength}** - This password needs improvement")
+    elif alert_type == "info":
+        st.info(f"{emoji} **{strength}** - This password is decent but could be better")
+    else:
+        st.success(f"{emoji} **{strength}** - Excellent password security!")
+
+    # Visual strength meter
+    strength_percentage = min(100, (entropy / 120) * 100)
+    st.progress(int(strength_percentage))
+
+    # Detailed analysis
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### Character Analysis")
+        for char_type, present in result['composition'].items():
+            status = "✅" if present else "❌"
+            char_name = analyzer.character_sets[char_type]['name']
+            st.write(f"{status} {char_name}")
+
+        st.markdown(f"**Estimated crack time:** {crack_time}")
+
+    with col2:
+        st.markdown("### Improvement Suggestions")
+        for suggestion in suggestions:
+            st.write(suggestion)
+
+    # Additional security info
+    with st.expander("🔍 Advanced Analysis"):
+        st.markdown("#### Security Metrics")
+        st.write(f"- **Total possible combinations:** 2^{entropy:.1f} ≈ 10^{entropy * _LOG10_OF_2:.1f}")
+        st.write(f"- **Character set size:** {result['charset_size']} characters")
+        st.write(f"- **Entropy per character:** {entropy/len(password):.2f} bits")
+
+        if result['missing_types']:
+            st.markdown("#### Missing Character Types")
+            for missing in result['missing_types']:
+                st.write(f"- {missing}")
+
+        if patterns:
+            st.markdown("#### Detected Weak Patterns")
+            for pattern in patterns:
+                st.write(f"- {pattern}")
 
 
 def main():
@@ -170,10 +371,7 @@ def main():
     
     st.title("🔐 Advanced Password Strength Analyzer")
     st.markdown("---")
-    
-    # Initialize analyzer
-    analyzer = PasswordAnalyzer()
-    
+
     # Input section
     col1, col2 = st.columns([2, 1])
     
@@ -197,92 +395,8 @@ def main():
     # Analysis section
     if password:
         st.markdown("---")
-        
-        # Calculate metrics
-        entropy = analyzer.calculate_entropy(password)
-        strength, emoji, alert_type = analyzer.get_strength_category(entropy)
-        crack_time = analyzer.estimate_crack_time(entropy)
-        analysis = analyzer.analyze_character_composition(password)
-        suggestions = analyzer.generate_suggestions(password)
-        
-        # Display results in columns
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Password Length", len(password))
-        
-        with col2:
-            st.metric("Entropy", f"{entropy:.1f} bits")
-        
-        with col3:
-            st.metric("Character Types", sum(analysis['composition'].values()))
-        
-        with col4:
-            st.metric("Charset Size", analysis['charset_size'])
-        
-        # Strength indicator
-        st.markdown("### Strength Assessment")
-        
-        if alert_type == "danger":
-            st.error(f"{emoji} **{strength}** - This password is easily crackable!")
-        elif alert_type == "warning":
-            st.warning(f"{emoji} **{strength}** - This password needs improvement")
-        elif alert_type == "info":
-            st.info(f"{emoji} **{strength}** - This password is decent but could be better")
-        else:
-            st.success(f"{emoji} **{strength}** - Excellent password security!")
-        
-        # Visual strength meter
-        strength_percentage = min(100, (entropy / 120) * 100)
-        progress_color = {
-            "danger": "#ff4444",
-            "warning": "#ff8800", 
-            "info": "#4488ff",
-            "success": "#44ff44"
-        }[alert_type]
-        
-        st.markdown(f"""
-        <div style="background-color: #e0e0e0; border-radius: 10px; overflow: hidden;">
-            <div style="width: {strength_percentage}%; height: 20px; background-color: {progress_color}; 
-                        border-radius: 10px; transition: width 0.3s ease;"></div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Detailed analysis
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### Character Analysis")
-            for char_type, present in analysis['composition'].items():
-                status = "✅" if present else "❌"
-                char_name = analyzer.character_sets[char_type]['name']
-                st.write(f"{status} {char_name}")
-            
-            st.markdown(f"**Estimated crack time:** {crack_time}")
-        
-        with col2:
-            st.markdown("### Improvement Suggestions")
-            for suggestion in suggestions:
-                st.write(suggestion)
-        
-        # Additional security info
-        with st.expander("🔍 Advanced Analysis"):
-            st.markdown("#### Security Metrics")
-            st.write(f"- **Total possible combinations:** 2^{entropy:.1f} ≈ {2**entropy:.2e}")
-            st.write(f"- **Character set size:** {analysis['charset_size']} characters")
-            st.write(f"- **Entropy per character:** {entropy/len(password):.2f} bits")
-            
-            if analysis['missing_types']:
-                st.markdown("#### Missing Character Types")
-                for missing in analysis['missing_types']:
-                    st.write(f"- {missing}")
-            
-            patterns = analyzer.check_common_patterns(password)
-            if patterns:
-                st.markdown("#### Detected Weak Patterns")
-                for pattern in patterns:
-                    st.write(f"- {pattern}")
-    
+        render_analysis(password)
+
     else:
         st.info("👆 Enter a password above to analyze its strength")
         